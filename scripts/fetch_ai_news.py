@@ -1,27 +1,50 @@
 #!/usr/bin/env python3
 """AI Topics: ニュース収集・カテゴリ分類・HTML生成スクリプト"""
 
-import json
+import asyncio
+import hashlib
+import html
 import os
 import re
 import sys
 import time
+import unicodedata
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
+from io import BytesIO
+from itertools import islice, zip_longest
 from pathlib import Path
 
 import anthropic
 import feedparser
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 SOURCES_PATH = BASE_DIR / "data" / "sources.json"
 ARTICLES_DIR = BASE_DIR / "data" / "articles"
+RECENT_ARTICLES_PATH = ARTICLES_DIR / "recent.json"
+FEED_CACHE_PATH = BASE_DIR / "data" / "feed_cache.json"
+CATEGORY_CACHE_PATH = BASE_DIR / "data" / "category_cache.json"
 OUTPUT_PATH = BASE_DIR / "ai-topics" / "index.html"
 
 JST = timezone(timedelta(hours=9))
 TODAY = datetime.now(JST).strftime("%Y-%m-%d")
 KEEP_DAYS = 7
+CATEGORY_CACHE_DAYS = 30
+# フィード取得の同時実行数（スレッド数・接続プールの上限を兼ねる）
+FETCH_CONCURRENCY = 32
+MAX_ENTRIES_PER_FEED = 30
+# 1リクエストで分類する最大件数（通常は全件を1回で送る）
+CLASSIFY_BATCH_SIZE = 200
+CLASSIFY_CONCURRENCY = 4
+CLASSIFY_ATTEMPTS = 2
 
 CATEGORIES = [
     "LLM・チャットAI",
@@ -40,87 +63,283 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; AITopicsBot/1.0; +https://ihrke-git-hub.github.io/ai-topics/)"
 }
 
+# 全フィード取得で共有するセッション（同一ホストへの接続・TLSを再利用し、一時的なエラーは再試行する）
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_ADAPTER = HTTPAdapter(
+    pool_connections=FETCH_CONCURRENCY,
+    pool_maxsize=FETCH_CONCURRENCY,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504)),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
 
 # ── 1. ソース読み込み ──
 
 def load_sources():
-    with open(SOURCES_PATH, encoding="utf-8") as f:
-        return json.load(f)
+    with open(SOURCES_PATH, "rb") as f:
+        return orjson.loads(f.read())
 
 
 # ── 2. RSS取得 ──
 
-def fetch_rss(source):
-    """RSSフィードから記事を取得する"""
-    articles = []
+def load_feed_cache():
+    """フィードごとのETag/Last-Modified・取得済み記事のキャッシュを読み込む"""
+    if not FEED_CACHE_PATH.exists():
+        return {}
     try:
-        resp = requests.get(source["url"], headers=HEADERS, timeout=20)
-        resp.raise_for_status()
-        feed = feedparser.parse(resp.content)
+        with open(FEED_CACHE_PATH, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError) as e:
+        print(f"  [WARN] フィードキャッシュ読み込み失敗: {e}")
+        return {}
+
 
-        for entry in feed.entries[:30]:
-            published = None
-            if hasattr(entry, "published_parsed") and entry.published_parsed:
-                published = time.strftime("%Y-%m-%d", entry.published_parsed)
-            elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                published = time.strftime("%Y-%m-%d", entry.updated_parsed)
+def save_feed_cache(feed_cache):
+    """フィードキャッシュを保存する"""
+    FEED_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(FEED_CACHE_PATH, "wb") as f:
+        f.write(orjson.dumps(feed_cache, option=orjson.OPT_INDENT_2))
 
-            if not published:
-                published = TODAY
 
-            title = entry.get("title", "").strip()
-            link = entry.get("link", "").strip()
-            if not title or not link:
+# RSS 2.0 / RSS 1.0 / Atom の日付要素（上から優先）
+_PUBLISHED_TAGS = ("pubDate", "published", "issued")
+_UPDATED_TAGS = ("updated", "date", "modified")
+
+
+def _feed_date(value):
+    """RFC 822 / ISO 8601の日付文字列をUTCの"YYYY-MM-DD"に変換する"""
+    value = value.strip()
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return dt.strftime("%Y-%m-%d")
+
+
+def parse_feed_fast(content):
+    """lxmlでRSS/Atomを逐次パースし、title・link・publishedだけを取り出す"""
+    events = etree.iterparse(
+        BytesIO(content), events=("end",), tag=("{*}item", "{*}entry"),
+        resolve_entities=False, no_network=True,
+    )
+    for _, elem in events:
+        fields = {}
+        for child in elem:
+            if not isinstance(child.tag, str):
                 continue
+            name = etree.QName(child).localname
+            if name == "link":
+                # Atomは<link href="...">、RSSは要素のテキスト
+                if child.get("rel", "alternate") == "alternate":
+                    fields.setdefault("link", child.get("href") or child.text or "")
+            elif name not in fields:
+                fields[name] = "".join(child.itertext())
+
+        published = None
+        for name in _PUBLISHED_TAGS + _UPDATED_TAGS:
+            if fields.get(name):
+                published = _feed_date(fields[name])
+                if published:
+                    break
+
+        yield {
+            "title": fields.get("title", ""),
+            "link": fields.get("link", ""),
+            "published": published,
+        }
+
+        # 処理済みの要素を解放してメモリを一定に保つ
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def parse_feed_full(content):
+    """feedparserでフィードをパースする（lxmlで読めないフィード向け）"""
+    feed = feedparser.parse(content)
+    for entry in feed.entries:
+        published = None
+        if hasattr(entry, "published_parsed") and entry.published_parsed:
+            published = time.strftime("%Y-%m-%d", entry.published_parsed)
+        elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
+            published = time.strftime("%Y-%m-%d", entry.updated_parsed)
+
+        yield {
+            "title": entry.get("title", ""),
+            "link": entry.get("link", ""),
+            "published": published,
+        }
+
+
+def parse_feed(source, content):
+    """フィード本文をパースして記事リストに変換する"""
+    try:
+        entries = list(islice(parse_feed_fast(content), MAX_ENTRIES_PER_FEED))
+    except etree.LxmlError as e:
+        print(f"  [INFO] {source['name']}: lxmlで解析できないためfeedparserを使用 ({e})")
+        entries = []
+    if not entries:
+        entries = list(islice(parse_feed_full(content), MAX_ENTRIES_PER_FEED))
+
+    articles = []
+    for entry in entries:
+        # フィードによっては実体参照が残るため、プレーンテキストに揃える
+        title = html.unescape(entry["title"]).strip()
+        link = entry["link"].strip()
+        if not title or not link:
+            continue
 
-            articles.append({
-                "title": title,
-                "url": link,
-                "source": source["name"],
-                "lang": source["lang"],
-                "date": published,
-            })
+        articles.append({
+            "title": title,
+            "url": link,
+            "source": source["name"],
+            "lang": source["lang"],
+            # 日付のないエントリはNoneのまま（キャッシュ後に当日扱いにする）
+            "date": entry["published"],
+        })
+    return articles
+
+
+def fetch_feed(source, feed_cache):
+    """RSSフィードから記事を取得する
+
+    前回のETag/Last-Modifiedで条件付きGETを行い、304または本文が前回と
+    同一の場合はパースせずキャッシュ済みの記事を返す。feed_cacheは更新される。
+    """
+    url = source["url"]
+    cached = feed_cache.get(url, {})
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        resp = _SESSION.get(url, headers=headers, timeout=20, stream=False, allow_redirects=True)
+        if resp.status_code == 304 and "articles" in cached:
+            return cached["articles"]
+        resp.raise_for_status()
+
+        content_hash = hashlib.blake2b(resp.content, digest_size=16).hexdigest()
+        if content_hash == cached.get("content_hash") and "articles" in cached:
+            articles = cached["articles"]
+        else:
+            articles = parse_feed(source, resp.content)
+
+        feed_cache[url] = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "content_hash": content_hash,
+            "articles": articles,
+        }
     except Exception as e:
         print(f"  [WARN] {source['name']}: {e}")
+        return []
     return articles
 
 
+def fetch_rss(source, feed_cache, date_cutoff):
+    """RSSフィードから直近の記事を取得する"""
+    # 日付のないエントリは当日扱いにする（キャッシュ内の記事は書き換えない）
+    articles = [{**a, "date": a["date"] or TODAY} for a in fetch_feed(source, feed_cache)]
+
+    # 日付の絞り込みを取得と同時に行う（"YYYY-MM-DD"は文字列比較で日付順になる）
+    return [a for a in articles if a["date"] >= date_cutoff]
+
+
 # ── 3. 記事収集 ──
 
 def collect_articles(sources):
     """全ソースから記事を収集し、当日分を抽出・重複排除する"""
+    # 取得時点で直近3日分に絞り込む（当日分が少ない場合の予備を含む）
+    now = datetime.now(JST)
+    three_days_ago = (now - timedelta(days=3)).strftime("%Y-%m-%d")
+
+    feed_cache = load_feed_cache()
+    fetch = partial(fetch_rss, feed_cache=feed_cache, date_cutoff=three_days_ago)
     all_articles = []
-    for source in sources:
-        print(f"  取得中: {source['name']}...")
-        articles = fetch_rss(source)
-        print(f"    → {len(articles)}件")
-        all_articles.extend(articles)
+    # 取得はI/O待ちが大半のため並列に実行する（結果はソース順を維持）
+    workers = max(1, min(FETCH_CONCURRENCY, len(sources)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(fetch, sources)
+        for source, articles in zip(sources, results):
+            print(f"  取得: {source['name']} → {len(articles)}件")
+            all_articles.extend(articles)
+
+    # 現在のソースに含まれないフィードのキャッシュは破棄する
+    urls = {source["url"] for source in sources}
+    save_feed_cache({url: v for url, v in feed_cache.items() if url in urls})
 
     # 当日の記事のみ抽出（直近2日分を許容。時差考慮）
-    yesterday = (datetime.now(JST) - timedelta(days=1)).strftime("%Y-%m-%d")
+    yesterday = (now - timedelta(days=1)).strftime("%Y-%m-%d")
     recent = [a for a in all_articles if a["date"] in (TODAY, yesterday)]
 
-    # 当日分が少なすぎる場合は直近3日に広げる
+    # 当日分が少なすぎる場合は直近3日に広げる（all_articlesは取得時に絞り込み済み）
     if len(recent) < 5:
-        three_days_ago = (datetime.now(JST) - timedelta(days=3)).strftime("%Y-%m-%d")
-        cutoff = datetime.strptime(three_days_ago, "%Y-%m-%d")
-        recent = [a for a in all_articles if datetime.strptime(a["date"], "%Y-%m-%d") >= cutoff]
+        recent = all_articles
 
-    # URL重複排除
+    # URL重複排除（ソース順で先に現れた記事を残す。set.addはNoneを返すため未出のURLだけが登録・採用される）
     seen_urls = set()
-    unique = []
-    for a in recent:
-        if a["url"] not in seen_urls:
-            seen_urls.add(a["url"])
-            unique.append(a)
-
-    return unique
+    return [a for a in recent if a["url"] not in seen_urls and not seen_urls.add(a["url"])]
 
 
 # ── 4. Claude APIでカテゴリ分類 ──
 
+def title_key(title):
+    """表記揺れを吸収した記事タイトルのキャッシュキーを返す"""
+    normalized = re.sub(r"[\W_]+", " ", unicodedata.normalize("NFKC", title).lower()).strip()
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_category_cache():
+    """分類結果のキャッシュを読み込み、分類から期限が過ぎたエントリを除く"""
+    if not CATEGORY_CACHE_PATH.exists():
+        return {}
+    try:
+        with open(CATEGORY_CACHE_PATH, "rb") as f:
+            cache = orjson.loads(f.read())
+    except (OSError, ValueError) as e:
+        print(f"  [WARN] カテゴリキャッシュ読み込み失敗: {e}")
+        return {}
+
+    cutoff = (datetime.now(JST) - timedelta(days=CATEGORY_CACHE_DAYS)).strftime("%Y-%m-%d")
+    return {k: v for k, v in cache.items() if v.get("ts", "") >= cutoff}
+
+
+def save_category_cache(category_cache):
+    """分類結果のキャッシュを保存する"""
+    CATEGORY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(CATEGORY_CACHE_PATH, "wb") as f:
+        f.write(orjson.dumps(category_cache, option=orjson.OPT_INDENT_2))
+
+
 def classify_articles(articles):
-    """Claude APIで記事をカテゴリ分類する"""
+    """記事をカテゴリ分類する（分類済みのタイトルはキャッシュを使う）"""
+    category_cache = load_category_cache()
+    misses = []
+    for a in articles:
+        cached = category_cache.get(title_key(a["title"]))
+        if cached and cached.get("category") in CATEGORIES:
+            a["category"] = cached["category"]
+        else:
+            misses.append(a)
+    print(f"  キャッシュ: {len(articles) - len(misses)}件ヒット / 未分類: {len(misses)}件")
+
+    if misses:
+        classify_with_claude(misses, category_cache)
+    save_category_cache(category_cache)
+    return articles
+
+
+def classify_with_claude(articles, category_cache):
+    """Claude APIで記事をカテゴリ分類し、成功した結果をキャッシュに記録する"""
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
         print("  [WARN] ANTHROPIC_API_KEY未設定。カテゴリは「AI製品・ツール」で統一します。")
@@ -128,19 +347,48 @@ def classify_articles(articles):
             a["category"] = "AI製品・ツール"
         return articles
 
-    client = anthropic.Anthropic(api_key=api_key)
-    categories_str = "\n".join(f"- {c}" for c in CATEGORIES)
+    # 全件を1リクエストにまとめる（上限を超える場合のみ分割し、並列に送る）
+    batches = [articles[i:i + CLASSIFY_BATCH_SIZE] for i in range(0, len(articles), CLASSIFY_BATCH_SIZE)]
+    asyncio.run(classify_batches(batches, api_key, category_cache))
+    return articles
+
+
+async def classify_batches(batches, api_key, category_cache):
+    """バッチを同時実行数を制限して並列に分類する"""
+    categories_str = "\n".join(f"{i + 1}: {c}" for i, c in enumerate(CATEGORIES))
+    sem = asyncio.Semaphore(CLASSIFY_CONCURRENCY)
+
+    async with anthropic.AsyncAnthropic(api_key=api_key) as client:
+
+        async def classify_batch(batch):
+            async with sem:
+                for attempt in range(CLASSIFY_ATTEMPTS):
+                    try:
+                        cats = await request_categories(client, batch, categories_str)
+                        break
+                    except Exception as e:
+                        print(f"  [WARN] Claude API エラー（{attempt + 1}回目）: {e}")
+                        if attempt + 1 < CLASSIFY_ATTEMPTS:
+                            await asyncio.sleep(0.5)
+                else:
+                    cats = []
+
+            # 失敗時はcatsが空のため全件が既定カテゴリになり、キャッシュもされない
+            for idx, a in enumerate(batch):
+                if idx < len(cats) and cats[idx] in CATEGORIES:
+                    a["category"] = cats[idx]
+                    category_cache[title_key(a["title"])] = {"category": cats[idx], "ts": TODAY}
+                else:
+                    a["category"] = "AI製品・ツール"
+
+        await asyncio.gather(*(classify_batch(b) for b in batches))
 
-    # バッチ処理（20件ずつ）
-    batch_size = 20
-    for i in range(0, len(articles), batch_size):
-        batch = articles[i:i + batch_size]
-        articles_list = "\n".join(
-            f'{idx+1}. [{a["lang"].upper()}] {a["title"]}'
-            for idx, a in enumerate(batch)
-        )
 
-        prompt = f"""以下の記事タイトルをそれぞれ1つのカテゴリに分類してください。
+async def request_categories(client, batch, categories_str):
+    """1バッチ分の記事タイトルを分類し、カテゴリ名のリストを返す"""
+    articles_list = "\n".join(f'{idx+1}. {a["title"]}' for idx, a in enumerate(batch))
+
+    prompt = f"""以下の記事タイトルをそれぞれ1つのカテゴリに分類してください。
 
 ## カテゴリ一覧
 {categories_str}
@@ -149,37 +397,30 @@ def classify_articles(articles):
 {articles_list}
 
 ## 出力形式
-JSON配列で、各要素は記事番号（1始まり）に対応するカテゴリ名の文字列です。
-カテゴリ名は上記一覧と完全一致させてください。
+JSON整数配列で、各要素は記事番号（1始まり）に対応するカテゴリ番号です。
 JSON配列のみを出力し、他のテキストは含めないでください。
 
-出力例: ["LLM・チャットAI", "画像・動画生成", ...]"""
-
-        try:
-            response = client.messages.create(
-                model="claude-haiku-4-5-20251001",
-                max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}],
-            )
-            text = response.content[0].text.strip()
-            # JSON部分を抽出
-            match = re.search(r'\[.*\]', text, re.DOTALL)
-            if match:
-                cats = json.loads(match.group())
-                for idx, a in enumerate(batch):
-                    if idx < len(cats) and cats[idx] in CATEGORIES:
-                        a["category"] = cats[idx]
-                    else:
-                        a["category"] = "AI製品・ツール"
-            else:
-                for a in batch:
-                    a["category"] = "AI製品・ツール"
-        except Exception as e:
-            print(f"  [WARN] Claude API エラー: {e}")
-            for a in batch:
-                a["category"] = "AI製品・ツール"
-
-    return articles
+出力例: [1,3,2,...]"""
+
+    response = await client.messages.create(
+        model="claude-haiku-4-5-20251001",
+        max_tokens=max(1024, 5 * len(batch)),
+        messages=[{"role": "user", "content": prompt}],
+    )
+    text = response.content[0].text.strip()
+    # JSON部分を抽出（最初の"["から最後の"]"まで）
+    start, end = text.find("["), text.rfind("]")
+    if not 0 <= start < end:
+        raise ValueError(f"JSON配列が見つかりません: {text[:80]}")
+    cat_ids = orjson.loads(text[start:end + 1])
+    # 件数がずれると以降の対応がすべて崩れるため、回答全体を採用しない
+    if len(cat_ids) != len(batch):
+        raise ValueError(f"回答件数が一致しません: {len(cat_ids)}件（記事{len(batch)}件）")
+    # カテゴリ番号をカテゴリ名に戻す（範囲外はNone）
+    return [
+        CATEGORIES[i - 1] if isinstance(i, int) and 1 <= i <= len(CATEGORIES) else None
+        for i in cat_ids
+    ]
 
 
 # ── 5. 記事の選定（10-15件） ──
@@ -190,67 +431,45 @@ def select_top_articles(articles, max_count=15):
         return articles
 
     # カテゴリごとにグループ化
-    by_cat = {}
+    by_cat = defaultdict(list)
     for a in articles:
-        cat = a.get("category", "AI製品・ツール")
-        if cat not in by_cat:
-            by_cat[cat] = []
-        by_cat[cat].append(a)
+        by_cat[a.get("category", "AI製品・ツール")].append(a)
 
     # ラウンドロビンで各カテゴリから均等に選出
-    selected = []
-    cat_keys = list(by_cat.keys())
-    idx_per_cat = {k: 0 for k in cat_keys}
-
-    while len(selected) < max_count:
-        added = False
-        for cat in cat_keys:
-            if idx_per_cat[cat] < len(by_cat[cat]) and len(selected) < max_count:
-                selected.append(by_cat[cat][idx_per_cat[cat]])
-                idx_per_cat[cat] += 1
-                added = True
-        if not added:
-            break
-
-    return selected
+    merged = (a for group in zip_longest(*by_cat.values()) for a in group if a is not None)
+    return list(islice(merged, max_count))
 
 
 # ── 6. データ保存・読み込み ──
 
-def save_articles(articles, date_str):
-    """当日分の記事をJSONに保存する"""
-    ARTICLES_DIR.mkdir(parents=True, exist_ok=True)
-    path = ARTICLES_DIR / f"{date_str}.json"
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(articles, f, ensure_ascii=False, indent=2)
-    print(f"  保存: {path} ({len(articles)}件)")
-
-
 def load_recent_articles():
-    """直近7日分の記事を読み込む"""
-    all_articles = {}
-    cutoff = datetime.now(JST) - timedelta(days=KEEP_DAYS)
+    """直近7日分の記事を日付ごとに読み込む（期限切れの日付は除く）"""
+    if not RECENT_ARTICLES_PATH.exists():
+        return {}
+    with open(RECENT_ARTICLES_PATH, "rb") as f:
+        stored = orjson.loads(f.read())
 
-    for path in sorted(ARTICLES_DIR.glob("*.json")):
-        date_str = path.stem
-        try:
-            file_date = datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=JST)
-        except ValueError:
-            continue
-
-        if file_date < cutoff:
-            # 古いファイルを削除
-            path.unlink()
-            print(f"  削除（古い）: {path}")
+    # 日付キーは"YYYY-MM-DD"なので文字列のまま比較する
+    all_articles = {}
+    cutoff = (datetime.now(JST) - timedelta(days=KEEP_DAYS)).strftime("%Y-%m-%d")
+    for date_str, articles in stored.items():
+        if date_str <= cutoff:
+            print(f"  削除（古い）: {date_str}")
             continue
-
-        with open(path, encoding="utf-8") as f:
-            articles = json.load(f)
         all_articles[date_str] = articles
 
     return all_articles
 
 
+def save_articles(all_articles):
+    """直近分の記事を1つのJSONにまとめて保存する"""
+    ARTICLES_DIR.mkdir(parents=True, exist_ok=True)
+    with open(RECENT_ARTICLES_PATH, "wb") as f:
+        f.write(orjson.dumps(dict(sorted(all_articles.items())), option=orjson.OPT_INDENT_2))
+    total = sum(len(v) for v in all_articles.values())
+    print(f"  保存: {RECENT_ARTICLES_PATH} ({len(all_articles)}日分 / {total}件)")
+
+
 # ── 7. HTML生成 ──
 
 CATEGORY_COLORS = {
@@ -265,54 +484,21 @@ CATEGORY_COLORS = {
     "企業・資金調達": "#84CC16",
     "医療・科学応用": "#14B8A6",
 }
+DEFAULT_CATEGORY_COLOR = "#6B7280"
 
+WEEKDAYS = ("月", "火", "水", "木", "金", "土", "日")
 
-def generate_html(all_articles, updated_at):
-    """ポータルサイトのHTMLを生成する"""
-    dates = sorted(all_articles.keys(), reverse=True)
 
-    # 日付タブHTML
-    date_tabs = ""
-    for i, d in enumerate(dates):
-        dt = datetime.strptime(d, "%Y-%m-%d")
-        weekdays = ["月", "火", "水", "木", "金", "土", "日"]
-        label = f'{dt.month}/{dt.day}({weekdays[dt.weekday()]})'
-        active = " active" if i == 0 else ""
-        date_tabs += f'<button class="tab{active}" onclick="showDate(\'{d}\')">{label}</button>\n'
+def _json_for_script(obj):
+    """<script>内に埋め込めるJSON文字列を返す（"</script>"で閉じられないよう"<"をエスケープ）"""
+    return orjson.dumps(obj).decode("utf-8").replace("<", "\\u003c")
 
-    # カテゴリフィルタHTML
-    cat_filters = '<button class="cat-btn active" onclick="filterCat(\'all\')">すべて</button>\n'
-    for cat in CATEGORIES:
-        color = CATEGORY_COLORS.get(cat, "#6B7280")
-        cat_filters += f'<button class="cat-btn" onclick="filterCat(\'{cat}\')" style="--cat-color:{color}">{cat}</button>\n'
 
-    # 日付ごとの記事セクション
-    date_sections = ""
-    for i, d in enumerate(dates):
-        display = "block" if i == 0 else "none"
-        articles = all_articles[d]
-        cards = ""
-        for a in articles:
-            cat = a.get("category", "AI製品・ツール")
-            color = CATEGORY_COLORS.get(cat, "#6B7280")
-            lang_badge = f'<span class="lang-badge lang-{a.get("lang", "en")}">{a.get("lang", "en").upper()}</span>'
-            cards += f'''<a href="{a["url"]}" target="_blank" rel="noopener" class="card" data-category="{cat}">
-                <div class="card-header">
-                    <span class="cat-tag" style="background:{color}">{cat}</span>
-                    {lang_badge}
-                </div>
-                <h3 class="card-title">{a["title"]}</h3>
-                <div class="card-meta">{a["source"]}</div>
-            </a>
-'''
-        if not cards:
-            cards = '<p class="no-articles">この日の記事はありません</p>'
-        date_sections += f'<div class="date-section" id="date-{d}" style="display:{display}">\n{cards}</div>\n'
-
-    # JSON data for JS
-    json_data = json.dumps(all_articles, ensure_ascii=False)
-
-    html = f"""<!DOCTYPE html>
+def iter_html(all_articles, updated_at):
+    """ポータルサイトのHTMLを断片ごとに生成する"""
+    dates = sorted(all_articles.keys(), reverse=True)
+
+    yield f"""<!DOCTYPE html>
 <html lang="ja">
 <head>
     <meta charset="UTF-8">
@@ -497,27 +683,83 @@ def generate_html(all_articles, updated_at):
         </div>
 
         <div class="date-tabs">
-            {date_tabs}
+            """
+
+    # 日付タブHTML
+    for i, d in enumerate(dates):
+        dt = datetime.fromisoformat(d)
+        label = f'{dt.month}/{dt.day}({WEEKDAYS[dt.weekday()]})'
+        active = " active" if i == 0 else ""
+        yield f'<button class="tab{active}" onclick="showDate(\'{d}\')">{label}</button>\n'
+
+    yield """
         </div>
 
         <div class="cat-filters">
-            {cat_filters}
-        </div>
+            """
+
+    # カテゴリフィルタHTML
+    yield '<button class="cat-btn active" onclick="filterCat(\'all\')">すべて</button>\n'
+    for cat in CATEGORIES:
+        color = CATEGORY_COLORS.get(cat, DEFAULT_CATEGORY_COLOR)
+        yield f'<button class="cat-btn" onclick="filterCat(\'{cat}\')" style="--cat-color:{color}">{cat}</button>\n'
 
-        <div id="content">
-            {date_sections}
+    yield """
         </div>
+
+        <div id="content"></div>
     </div>
 
+    <script id="articles-data" type="application/json">"""
+
+    # 記事データはJSONで1回だけ埋め込み、カードはブラウザ側で組み立てる
+    yield _json_for_script(all_articles)
+
+    yield f"""</script>
+
     <script>
+    const ARTICLES = JSON.parse(document.getElementById('articles-data').textContent);
+    const CATEGORY_COLORS = {_json_for_script(CATEGORY_COLORS)};
     let currentDate = '{dates[0] if dates else TODAY}';
     let currentCat = 'all';
 
+    function el(tag, className, text) {{
+        const e = document.createElement(tag);
+        e.className = className;
+        if (text !== undefined) e.textContent = text;
+        return e;
+    }}
+
+    function renderDate(d) {{
+        let section = document.getElementById('date-' + d);
+        if (section) return section;
+        section = el('div', 'date-section');
+        section.id = 'date-' + d;
+        const articles = ARTICLES[d] || [];
+        articles.forEach(a => {{
+            const cat = a.category || 'AI製品・ツール';
+            const lang = a.lang || 'en';
+            const card = el('a', 'card');
+            card.href = a.url;
+            card.target = '_blank';
+            card.rel = 'noopener';
+            card.dataset.category = cat;
+            const header = el('div', 'card-header');
+            const tag = el('span', 'cat-tag', cat);
+            tag.style.background = CATEGORY_COLORS[cat] || '{DEFAULT_CATEGORY_COLOR}';
+            header.append(tag, el('span', 'lang-badge lang-' + lang, lang.toUpperCase()));
+            card.append(header, el('h3', 'card-title', a.title), el('div', 'card-meta', a.source));
+            section.appendChild(card);
+        }});
+        if (!articles.length) section.appendChild(el('p', 'no-articles', 'この日の記事はありません'));
+        document.getElementById('content').appendChild(section);
+        return section;
+    }}
+
     function showDate(d) {{
         currentDate = d;
         document.querySelectorAll('.date-section').forEach(el => el.style.display = 'none');
-        const target = document.getElementById('date-' + d);
-        if (target) target.style.display = 'block';
+        renderDate(d).style.display = 'block';
         document.querySelectorAll('.tab').forEach(b => b.classList.remove('active'));
         event.target.classList.add('active');
         applyFilter();
@@ -557,10 +799,11 @@ def generate_html(all_articles, updated_at):
             noMsg.style.display = 'none';
         }}
     }}
+
+    if (currentDate in ARTICLES) renderDate(currentDate);
     </script>
 </body>
 </html>"""
-    return html
 
 
 # ── メイン処理 ──
@@ -587,20 +830,19 @@ def main():
     articles = select_top_articles(articles, max_count=15)
     print(f"  選定: {len(articles)}件")
 
-    # 保存
-    save_articles(articles, TODAY)
+    # 保存（直近分に当日分を統合する）
+    all_articles = load_recent_articles()
+    all_articles[TODAY] = articles
+    save_articles(all_articles)
 
     print("\n[5/5] HTML生成...")
-    all_articles = load_recent_articles()
     total = sum(len(v) for v in all_articles.values())
     print(f"  表示対象: {len(all_articles)}日分 / {total}件")
 
     updated_at = datetime.now(JST).strftime("%Y年%m月%d日 %H:%M JST")
-    html = generate_html(all_articles, updated_at)
-
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        f.write(html)
+    with open(OUTPUT_PATH, "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.writelines(iter_html(all_articles, updated_at))
     print(f"  出力: {OUTPUT_PATH}")
 
     print("\n=== 完了 ===")